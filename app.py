@@ -1,23 +1,43 @@
-import json
 import re
 import os
-from flask import Flask, request, jsonify, render_template_string
+import sys
+from functools import lru_cache
+from flask import Flask, Response, request
 import logging
+import numpy as np
+import orjson
 from langdetect import detect, DetectorFactory, LangDetectException
+from langdetect.detector_factory import init_factory
 from rapidfuzz import process, fuzz
 
 app = Flask(__name__)
 
 # --- CONFIGURATION ---
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+# Logging defaults to WARNING. Per-request tracing is logged at DEBUG with lazy
+# %-style arguments, so it is only formatted when LOG_LEVEL=DEBUG is set.
+LOG_LEVEL = getattr(logging, os.environ.get('LOG_LEVEL', 'WARNING').upper(), logging.WARNING)
+logging.basicConfig(level=LOG_LEVEL, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 DetectorFactory.seed = 0
+# langdetect otherwise loads its language profiles lazily inside the first detect()
+# call, which makes the first request slow and races when two threads hit it at once.
+init_factory()
 
-INDEX_FILE = 'faq_index.json'
+INDEX_FILE = os.path.join(app.root_path, 'faq_index.json')
+CHAT_PAGE_FILE = os.path.join(app.root_path, 'templates', 'chat.html')
 LANGUAGES = ["en", "hi", "id", "hinglish"]
 FUZZY_MATCH_THRESHOLD = 75
 MINIMUM_SCORE_THRESHOLD = 0.5 
 ACTION_WEIGHT = 2.0
+# Threads rapidfuzz may use for one query's score matrix (-1 = all cores). Defaults
+# to 1 because gunicorn already runs a worker per core with several threads each;
+# raise it when serving with few workers.
+FUZZY_WORKERS = int(os.environ.get('FUZZY_WORKERS', 1))
+
+# Regexes used on every request are compiled once at import time.
+TOKEN_STRIP_RE = re.compile(r"[^\w\s\u0900-\u097F?!.-]")
+WORD_SPLIT_RE = re.compile(r'\W+')
+DEVANAGARI_RE = re.compile(r'[\u0900-\u097F]')
 
 # CORRECTED: Added a set of stop words to be removed from queries.
 # This is the key fix to focus the search on meaningful keywords.
@@ -40,9 +60,9 @@ def load_search_index():
         if not os.path.exists(INDEX_FILE):
             logger.warning(f"Index file '{INDEX_FILE}' not found. Creating fallback data.")
             return create_fallback_index()
-        with open(INDEX_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, Exception) as e:
+        with open(INDEX_FILE, 'rb') as f:
+            return orjson.loads(f.read())
+    except (orjson.JSONDecodeError, Exception) as e:
         logger.error(f"Error loading '{INDEX_FILE}': {e}")
         return create_fallback_index()
 
@@ -51,34 +71,96 @@ def create_fallback_index():
 
 search_index = load_search_index()
 
-SPAM_PATTERNS = [r'(.)\1{4,}']
-ACTION_KEYWORDS = ["download", "save", "share", "send", "forward", "bhej", "install", "upload", "record"]
+SPAM_PATTERNS = [re.compile(r'(.)\1{4,}')]
+ACTION_KEYWORDS = {"download", "save", "share", "send", "forward", "bhej", "install", "upload", "record"}
 HINGLISH_MAPPINGS = {
     "kese": "how", "kaise": "how", "karu": "do", "karo": "do", "bhej": "share",
     "kyu": "why", "etna": "so", "hai": "is", "nahi": "not", "ho": "be",
     "tha": "was", "mein": "in", "par": "on", "se": "from", "ko": "to"
 }
+HINGLISH_SPECIFIC_WORDS = frozenset({"kese", "kaise", "karu", "karo", "bhej", "kyu"})
+
+# Hinglish mapping and stop-word removal folded into a single lookup: a token maps
+# to its replacement, or to None when it (or its mapping) is a stop word.
+TOKEN_REWRITES = {word: None for word in STOP_WORDS}
+TOKEN_REWRITES.update({
+    token: None if mapped in STOP_WORDS else mapped
+    for token, mapped in HINGLISH_MAPPINGS.items()
+})
+
+# Keyword importance (IDF x action boost) never changes after the index is loaded,
+# so it is computed once here instead of inside the scoring loop of every request.
+def build_keyword_importance(index):
+    return {
+        sys.intern(keyword): idf * (ACTION_WEIGHT if keyword in ACTION_KEYWORDS else 1.0)
+        for keyword, idf in index.get('idf_scores', {}).items()
+    }
+
+KEYWORD_IMPORTANCE = build_keyword_importance(search_index)
+
+# All document keywords laid out back to back, with the owning document of each
+# position, so a query word is scored against the whole corpus in one call.
+# Keywords shared by several documents are interned to a single string object.
+def build_keyword_corpus(index):
+    keywords, keyword_docs = [], []
+    for doc_idx, doc in enumerate(index.get('documents', [])):
+        for keyword in doc.get('keywords', []):
+            keywords.append(sys.intern(keyword))
+            keyword_docs.append(doc_idx)
+    return tuple(keywords), np.array(keyword_docs, dtype=np.intp)
+
+ALL_KEYWORDS, KEYWORD_DOCS = build_keyword_corpus(search_index)
+# Importance of each corpus position, parallel to ALL_KEYWORDS.
+KEYWORD_WEIGHTS = np.array([KEYWORD_IMPORTANCE.get(keyword, 0.05) for keyword in ALL_KEYWORDS],
+                           dtype=np.float32)
+# Each document's keywords form one contiguous run (segment) of the corpus:
+# where each run starts, which document it belongs to, and each position's run.
+KEYWORD_POSITIONS = np.arange(len(ALL_KEYWORDS))
+SEGMENT_STARTS = np.flatnonzero(np.diff(KEYWORD_DOCS, prepend=-1))
+SEGMENT_DOCS = KEYWORD_DOCS[SEGMENT_STARTS]
+KEYWORD_SEGMENTS = np.searchsorted(SEGMENT_STARTS, KEYWORD_POSITIONS, side='right') - 1
 
 # CORRECTED: This function now removes stop words after normalization.
+# Results are memoized (as tuples, so cached values can't be mutated) because
+# the same query is tokenized more than once per request and users repeat questions.
+@lru_cache(maxsize=4096)
 def normalize_and_tokenize_query(text):
     if not isinstance(text, str) or len(text.strip()) == 0:
-        return []
-    text = text.lower().strip()
-    text = re.sub(r'\s+', ' ', text)
-    text = re.sub(r"[^\w\s\u0900-\u097F?!.-]", "", text)
-    tokens = text.split()
-    
-    mapped_tokens = [HINGLISH_MAPPINGS.get(token, token) for token in tokens]
+        return ()
+    # A single strip pass is enough: split() already collapses runs of whitespace.
+    tokens = TOKEN_STRIP_RE.sub("", text.lower()).split()
     
-    # Filter out stop words to focus on the query's intent
-    filtered_tokens = [token for token in mapped_tokens if token not in STOP_WORDS]
+    # Map Hinglish words and filter out stop words to focus on the query's intent
+    rewritten_tokens = (TOKEN_REWRITES.get(token, token) for token in tokens)
+    filtered_tokens = tuple(token for token in rewritten_tokens if token is not None)
     
-    logger.info(f"Original tokens: {mapped_tokens}, Filtered (no stop words): {filtered_tokens}")
+    logger.debug("Original tokens: %s, Filtered (no stop words): %s", tokens, filtered_tokens)
     return filtered_tokens
 
+# Exact questions and paraphrases from the index, keyed by their query tokens, so
+# a message that repeats one verbatim skips fuzzy scoring. Token sequences shared
+# by more than one document are left out and go through normal matching.
+def build_phrase_lookup(index):
+    phrase_docs = {}
+    for doc_idx, doc in enumerate(index.get('documents', [])):
+        for phrase in doc.get('phrases', []):
+            tokens = normalize_and_tokenize_query(phrase)
+            if tokens:
+                phrase_docs.setdefault(tokens, set()).add(doc_idx)
+    return {tokens: doc_ids.pop() for tokens, doc_ids in phrase_docs.items() if len(doc_ids) == 1}
+
+PHRASE_DOCS = build_phrase_lookup(search_index)
+
+# The request path only needs each document's id and answers, kept as lists
+# parallel to the tables above. Everything else in the raw index (keyword and
+# phrase lists, idf map) has been folded into those tables, so it is released.
+DOC_IDS = [doc.get('id') for doc in search_index.get('documents', [])]
+DOC_ANSWERS = [doc.get('answers', {}) for doc in search_index.get('documents', [])]
+del search_index
+
 def is_nonsensical_query(text, tokens):
     for pattern in SPAM_PATTERNS:
-        if re.search(pattern, text.lower()):
+        if pattern.search(text.lower()):
             return True
     if len(text.strip()) < 3 and len(tokens) == 0:
         return True
@@ -86,6 +168,9 @@ def is_nonsensical_query(text, tokens):
         return True
     return False
 
+# langdetect's n-gram scoring is the most expensive step for messages the word
+# lists can't classify, and its result depends only on the text.
+@lru_cache(maxsize=2048)
 def detect_language_safe(text):
     try:
         if len(text.strip()) < 3: return 'en'
@@ -94,1254 +179,148 @@ def detect_language_safe(text):
     except (LangDetectException, Exception):
         return 'en'
 
-def find_best_match(user_query):
-    # This now receives tokens with stop words already removed
-    user_keywords = normalize_and_tokenize_query(user_query)
-    if not user_keywords:
+# Common function words of the two Latin-script languages we answer in. A clear
+# majority settles the language without running langdetect's n-gram model.
+ENGLISH_MARKER_WORDS = frozenset({
+    'how', 'what', 'why', 'who', 'where', 'when', 'which', 'can', 'does', 'do', 'is', 'are',
+    'the', 'a', 'an', 'to', 'of', 'my', 'i', 'you', 'your', 'it', 'not', 'with', 'for', 'and'
+})
+INDONESIAN_MARKER_WORDS = frozenset({
+    'bagaimana', 'gimana', 'cara', 'apa', 'apakah', 'kenapa', 'mengapa', 'siapa', 'bisa',
+    'tidak', 'yang', 'dan', 'di', 'dari', 'untuk', 'dengan', 'saya', 'aku', 'kamu',
+    'anda', 'ini', 'itu', 'tolong', 'unduh', 'simpan', 'hapus', 'menghapus', 'mengunduh',
+    'menyimpan', 'aplikasi'
+})
+
+def detect_reply_language(text):
+    # Script and word-list checks answer almost every query; langdetect is the fallback.
+    if DEVANAGARI_RE.search(text):
+        return 'hi'
+    words = [word.lower() for word in WORD_SPLIT_RE.split(text) if word]
+    if not HINGLISH_SPECIFIC_WORDS.isdisjoint(words):
+        return 'hinglish'
+    if text.isascii():
+        # Every occurrence votes, so reduplicated markers ('apa-apa') count twice.
+        english_votes = sum(word in ENGLISH_MARKER_WORDS for word in words)
+        indonesian_votes = sum(word in INDONESIAN_MARKER_WORDS for word in words)
+        if english_votes != indonesian_votes:
+            return 'en' if english_votes > indonesian_votes else 'id'
+    return detect_language_safe(text)
+
+# Scoring only depends on which words the query contains, not their order, so
+# results are cached on the sorted tokens and reworded repeats are free too.
+@lru_cache(maxsize=4096)
+def score_documents(sorted_keywords):
+    # All user words are scored against the whole corpus in a single cdist call
+    # (a words x keywords matrix; scores under the cutoff come back as 0). Both
+    # sides are already normalized, so rapidfuzz must not preprocess them again.
+    # Scores are rounded to whole percentages, which fit in a uint8 matrix.
+    scores = process.cdist(sorted_keywords, ALL_KEYWORDS, scorer=fuzz.ratio, processor=None,
+                           score_cutoff=FUZZY_MATCH_THRESHOLD, dtype=np.uint8, workers=FUZZY_WORKERS)
+    # No word came close to any keyword, so there is nothing to aggregate.
+    if not scores.any():
+        return None, 0.0
+
+    # For every user word, each document takes its best keyword; on ties the
+    # earlier keyword wins, as it did with the per-document extractOne.
+    best_scores = np.maximum.reduceat(scores, SEGMENT_STARTS, axis=1)
+    is_best = scores == best_scores[:, KEYWORD_SEGMENTS]
+    best_keywords = np.minimum.reduceat(np.where(is_best, KEYWORD_POSITIONS, len(ALL_KEYWORDS)),
+                                        SEGMENT_STARTS, axis=1)
+    matched = best_scores > 0
+    contributions = np.where(matched, (best_scores / 100) * KEYWORD_WEIGHTS[best_keywords], 0.0)
+    matched_counts = matched.sum(axis=0)
+
+    # Boost score based on number of matched keywords
+    doc_scores = contributions.sum(axis=0) * np.where(matched_counts > 0, 1 + (matched_counts - 1) * 0.2, 1.0)
+
+    best_segment = int(np.argmax(doc_scores))
+    best_score = float(doc_scores[best_segment])
+    best_doc_idx = int(SEGMENT_DOCS[best_segment]) if best_score > 0 else None
+    return best_doc_idx, best_score
+
+def find_best_match(user_query, user_keywords):
+    # user_keywords are the query tokens the caller already computed with
+    # normalize_and_tokenize_query (stop words removed), so they aren't re-derived here.
+    # Returns the index of the matching document, or None.
+    if not user_keywords or not ALL_KEYWORDS:
         return None
 
-    documents = search_index.get('documents', [])
-    idf_scores = search_index.get('idf_scores', {})
-    
-    best_score = 0
-    best_match_doc = None
+    phrase_doc_idx = PHRASE_DOCS.get(user_keywords)
+    if phrase_doc_idx is not None:
+        logger.debug("Exact phrase match for '%s' (Doc ID: %s)", user_query, DOC_IDS[phrase_doc_idx])
+        return phrase_doc_idx
 
-    for doc in documents:
-        doc_keywords = doc.get('keywords', [])
-        if not doc_keywords: continue
-            
-        current_doc_score = 0
-        matched_keywords_count = 0
+    best_doc_idx, best_score = score_documents(tuple(sorted(user_keywords)))
+
+    if best_doc_idx is not None and best_score >= MINIMUM_SCORE_THRESHOLD:
+        logger.debug("Found match for '%s' (Doc ID: %s) with score %.3f", user_query, DOC_IDS[best_doc_idx], best_score)
+        return best_doc_idx
+    else:
+        logger.debug("No good match found for '%s' (best score: %.3f)", user_query, best_score)
+        return None
 
-        for user_word in user_keywords:
-            if user_word in doc_keywords:
-                keyword_importance = idf_scores.get(user_word, 0.1) * (ACTION_WEIGHT if user_word in ACTION_KEYWORDS else 1.0)
-                current_doc_score += keyword_importance
-                matched_keywords_count += 1
-            else:
-                best_match = process.extractOne(user_word, doc_keywords, scorer=fuzz.ratio)
-                if best_match and best_match[1] >= FUZZY_MATCH_THRESHOLD:
-                    matched_keyword = best_match[0]
-                    keyword_importance = idf_scores.get(matched_keyword, 0.05) * (ACTION_WEIGHT if matched_keyword in ACTION_KEYWORDS else 1.0)
-                    fuzzy_score = (best_match[1] / 100) * keyword_importance
-                    current_doc_score += fuzzy_score
-                    matched_keywords_count += 1
+NONSENSE_RESPONSE = "I can help with WhatsApp Status Saver. Try asking 'how to download status'."
+FALLBACK_RESPONSES = {
+    'en': "I couldn't find a specific answer. Try asking about:\n• How to download/save a status\n• Permission or storage issues",
+    'hi': "मुझे विशिष्ट उत्तर नहीं मिला। पूछने की कोशिश करें:\n• स्टेटस कैसे डाउनलोड/सेव करें\n• अनुमति/स्टोरेज समस्याएं",
+    'hinglish': "Mujhe specific answer nahi mila. Try pucho:\n• Status kaise download/save kare\n• Permission/storage issues"
+}
 
-        # Boost score based on number of matched keywords
-        if matched_keywords_count > 0:
-            current_doc_score *= (1 + (matched_keywords_count - 1) * 0.2)
+# The reply is a pure function of the message text, so repeated questions
+# skip language detection and matching entirely.
+@lru_cache(maxsize=2048)
+def build_response(user_input):
+    tokens = normalize_and_tokenize_query(user_input)
+    
+    if is_nonsensical_query(user_input, tokens):
+        return NONSENSE_RESPONSE
+    
+    # --- Language Detection ---
+    reply_lang = detect_reply_language(user_input)
+    
+    logger.debug("Final detected language for reply: '%s'", reply_lang)
 
-        if current_doc_score > best_score:
-            best_score = current_doc_score
-            best_match_doc = doc
+    best_doc_idx = find_best_match(user_input, tokens)
 
-    if best_match_doc and best_score >= MINIMUM_SCORE_THRESHOLD:
-        logger.info(f"Found match for '{user_query}' (Doc ID: {best_match_doc.get('id')}) with score {best_score:.3f}")
-        return best_match_doc
-    else:
-        logger.info(f"No good match found for '{user_query}' (best score: {best_score:.3f})")
-        return None
+    if best_doc_idx is not None and DOC_ANSWERS[best_doc_idx]:
+        answers = DOC_ANSWERS[best_doc_idx]
+        return answers.get(reply_lang, answers.get('en'))
+    return FALLBACK_RESPONSES.get(reply_lang, FALLBACK_RESPONSES['en'])
 
-HTML_TEMPLATE = """
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>WhatsApp FAQ Bot</title>
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Roboto:wght@300;400;500;600&display=swap');
-        body{font-family:'Roboto',sans-serif;background:#e5ddd5;display:flex;justify-content:center;align-items:center;min-height:100vh;padding:20px;margin:0}
-        .chat-container{width:100%;max-width:450px;height:90vh;max-height:700px;display:flex;flex-direction:column;background-color:#f0f0f0;border-radius:8px;box-shadow:0 4px 12px rgba(0,0,0,.15);overflow:hidden}
-        .chat-header{background:linear-gradient(135deg,#075E54 0%,#128C7E 100%);color:#fff;padding:15px 20px;font-weight:500;font-size:1.1rem;text-align:center;position:relative;box-shadow:0 2px 4px rgba(0,0,0,.1)}.chat-header h1{font-size:1.1rem;font-weight:500}
-        .chat-box{flex-grow:1;padding:20px;overflow-y:auto;background-color:#e5ddd5;background-image:url('data:image/svg+xml;utf8,<svg xmlns="http://www.w3.org/2000/svg" width="40" height="40" viewBox="0 0 40 40"><circle cx="20" cy="20" r="1" fill="%23000" opacity="0.02"/></svg>')}
-        .message{display:flex;margin-bottom:15px;max-width:80%;animation:messageSlide .3s ease-out}@keyframes messageSlide{from{opacity:0;transform:translateY(10px)}to{opacity:1;transform:translateY(0)}}
-        .message-content{padding:10px 15px;border-radius:12px;line-height:1.4;white-space:pre-wrap;word-wrap:break-word;position:relative;box-shadow:0 1px 2px rgba(0,0,0,.1);font-size:14px}
-        .user{margin-left:auto;flex-direction:row-reverse}.user .message-content{background-color:#dcf8c6;color:#303030;border-top-right-radius:0}
-        .bot .message-content{background-color:#fff;color:#303030;border-top-left-radius:0}
-        .typing-indicator{display:none;padding:10px 15px;background-color:#fff;border-radius:12px;border-top-left-radius:0;align-items:center;box-shadow:0 1px 2px rgba(0,0,0,.1);animation:messageSlide .3s ease-out}.typing-indicator span{height:8px;width:8px;background-color:#999;border-radius:50%;display:inline-block;margin:0 2px;animation:bounce 1.3s infinite ease-in-out}.typing-indicator span:nth-child(2){animation-delay:-1.1s}.typing-indicator span:nth-child(3){animation-delay:-.9s}@keyframes bounce{0%,80%,100%{transform:scale(0)}40%{transform:scale(1)}}
-        .input-area{display:flex;padding:10px;background-color:#f0f0f0;border-top:1px solid #ddd;gap:10px}
-        #user-input{flex-grow:1;border:none;padding:12px 15px;border-radius:25px;font-size:1rem;font-family:'Roboto',sans-serif;background-color:#fff;transition:all .2s ease}#user-input:focus{outline:0;box-shadow:0 0 0 2px rgba(37,211,102,.3)}
-        #send-btn{background:linear-gradient(135deg,#128C7E 0%,#075E54 100%);color:#fff;border:none;border-radius:50%;width:50px;height:50px;cursor:pointer;font-size:24px;display:flex;justify-content:center;align-items:center;transition:all .2s ease;box-shadow:0 2px 4px rgba(0,0,0,.2)}#send-btn:hover{background:linear-gradient(135deg,#075E54 0%,#128C7E 100%);transform:translateY(-1px);box-shadow:0 4px 8px rgba(0,0,0,.3)}#send-btn:disabled{opacity:.6;cursor:not-allowed;transform:none}
-        .loading{animation:spin 1s linear infinite}@keyframes spin{from{transform:rotate(0)}to{transform:rotate(360deg)}}
-    </style>
-</head>
-<body>
-    <div class="chat-container">
-        <div class="chat-header"><h1>WhatsApp FAQ Bot</h1></div>
-        <div class="chat-box" id="chat-box">
-            <div class="message bot"><div class="message-content">Hello! I'm here to help with WhatsApp Status Saver questions. Ask me anything about downloading or saving WhatsApp statuses!</div></div>
-        </div>
-        <div class="input-area">
-            <input type="text" id="user-input" placeholder="Ask about WhatsApp status saving..." autocomplete="off" maxlength="200">
-            <button id="send-btn">➤</button>
-        </div>
-    </div>
-    <script>
-        const chatBox=document.getElementById("chat-box"),userInput=document.getElementById("user-input"),sendBtn=document.getElementById("send-btn");let isProcessing=!1;function addMessage(e,t){const s=document.createElement("div");s.classList.add("message",t);const n=document.createElement("div");n.classList.add("message-content"),n.textContent=e,s.appendChild(n),chatBox.appendChild(s),setTimeout(()=>{chatBox.scrollTop=chatBox.scrollHeight},100)}function showTypingIndicator(){const e=document.createElement("div");e.classList.add("message","bot"),e.innerHTML='<div class="typing-indicator"><span></span><span></span><span></span></div>',chatBox.appendChild(e),e.querySelector(".typing-indicator").style.display="flex",setTimeout(()=>{chatBox.scrollTop=chatBox.scrollHeight},100)}function hideTypingIndicator(){const e=document.querySelector(".typing-indicator");e&&e.closest(".message").remove()}async function handleSendMessage(){const e=userInput.value.trim();if(!e||isProcessing)return;isProcessing=!0,sendBtn.disabled=!0,sendBtn.innerHTML="⟳",sendBtn.classList.add("loading"),addMessage(e,"user"),userInput.value="",showTypingIndicator();try{const t=await fetch("/chat",{method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({message:e})});if(!t.ok)throw new Error(`HTTP ${t.status}`);const s=await t.json();hideTypingIndicator(),setTimeout(()=>{addMessage(s.response||"Sorry, no response received.","bot")},300)}catch(e){hideTypingIndicator(),console.error("Error:",e),addMessage("Sorry, something went wrong. Please try again later.","bot")}finally{isProcessing=!1,sendBtn.disabled=!1,sendBtn.innerHTML="➤",sendBtn.classList.remove("loading"),userInput.focus()}}sendBtn.addEventListener("click",handleSendMessage),userInput.addEventListener("keypress",e=>{e.key==="Enter"&&!e.shiftKey&&(e.preventDefault(),handleSendMessage())}),window.addEventListener("load",()=>{userInput.focus()}),userInput.addEventListener("input",e=>{const t=e.target.value;t.length>200&&(e.target.value=t.substring(0,200))});
-    </script>
-</body>
-</html>
-"""
+# The chat page has no template variables, so it is read once and served as-is.
+with open(CHAT_PAGE_FILE, 'rb') as f:
+    HTML_PAGE = f.read()
 
 @app.route('/')
 def home():
-    return render_template_string(HTML_TEMPLATE)
+    return Response(HTML_PAGE, mimetype='text/html', headers={'Cache-Control': 'public, max-age=3600'})
+
+# /chat payloads are parsed and serialized with orjson directly, skipping Flask's
+# JSON provider and the stdlib json module.
+def json_response(payload, status=200):
+    return Response(orjson.dumps(payload), status=status, mimetype='application/json')
 
 @app.route('/chat', methods=['POST'])
 def chat():
     try:
-        data = request.get_json()
-        if not data or 'message' not in data or not isinstance(data['message'], str):
-            return jsonify({"response": "Invalid message format."}), 400
+        try:
+            data = orjson.loads(request.get_data())
+        except orjson.JSONDecodeError:
+            data = None
+        if not isinstance(data, dict) or not isinstance(data.get('message'), str):
+            return json_response({"response": "Invalid message format."}, 400)
 
         user_input = data['message'].strip()
         if not user_input or len(user_input) > 200:
-            return jsonify({"response": "Message is empty or too long."})
+            return json_response({"response": "Message is empty or too long."})
 
-        tokens = normalize_and_tokenize_query(user_input)
-        
-        if is_nonsensical_query(user_input, tokens):
-            return jsonify({"response": "I can help with WhatsApp Status Saver. Try asking 'how to download status'."})
-        
-        # --- Language Detection ---
-        hinglish_specific_words = {"kese", "kaise", "karu", "karo", "bhej", "kyu"}
-        original_tokens = [word.lower() for word in re.split(r'\W+', user_input) if word]
-        
-        if re.search(r'[\u0900-\u097F]', user_input):
-            reply_lang = 'hi'
-        elif any(token in hinglish_specific_words for token in original_tokens):
-            reply_lang = 'hinglish'
-        else:
-            reply_lang = detect_language_safe(user_input)
-        
-        logger.info(f"Final detected language for reply: '{reply_lang}'")
-
-        best_doc = find_best_match(user_input)
-
-        if best_doc and 'answers' in best_doc:
-            response_text = best_doc['answers'].get(reply_lang, best_doc['answers'].get('en'))
-        else:
-            fallback_responses = {
-                'en': "I couldn't find a specific answer. Try asking about:\n• How to download/save a status\n• Permission or storage issues",
-                'hi': "मुझे विशिष्ट उत्तर नहीं मिला। पूछने की कोशिश करें:\n• स्टेटस कैसे डाउनलोड/सेव करें\n• अनुमति/स्टोरेज समस्याएं",
-                'hinglish': "Mujhe specific answer nahi mila. Try pucho:\n• Status kaise download/save kare\n• Permission/storage issues"
-            }
-            response_text = fallback_responses.get(reply_lang, fallback_responses['en'])
-
-        return jsonify({"response": response_text})
+        return json_response({"response": build_response(user_input)})
 
     except Exception as e:
         logger.error(f"Error in chat endpoint: {e}", exc_info=True)
-        return jsonify({"response": "Sorry, I encountered an error."}), 500
+        return json_response({"response": "Sorry, I encountered an error."}, 500)
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=False)
 # uses faq_index.json #
-
-# import json
-# import re
-# from flask import Flask, request, jsonify, render_template_string
-# import logging
-# from langdetect import detect, DetectorFactory, LangDetectException
-# from rapidfuzz import process, fuzz
-# import string
-# from collections import Counter
-# import math
-
-# app = Flask(__name__)
-
-# # --- CONFIGURATION ---
-# logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-# logger = logging.getLogger(__name__)
-# DetectorFactory.seed = 0
-
-# INDEX_FILE = 'faq_index.json'
-# # Enhanced language support
-# LANGUAGES = ["en", "hi", "id", "hinglish", "es", "fr", "de", "pt", "ar", "bn", "ta", "te", "mr", "gu", "kn", "ml", "pa", "or", "as", "ur"]
-# FUZZY_MATCH_THRESHOLD = 75  # Slightly lowered for better matching
-# MINIMUM_SCORE_THRESHOLD = 0.3  # Lowered for more flexible matching
-# CONTEXT_BONUS_MULTIPLIER = 1.5  # Bonus for contextually relevant matches
-
-# # Language detection patterns for better accuracy
-# LANGUAGE_PATTERNS = {
-#     'hinglish': [
-#         r'\b(hai|hain|kar|kya|kaise|kahan|kyun|matlab|bhai|yaar|abhi|phir|wala|wali)\b',
-#         r'\b(app|download|save|status|whatsapp)\b.*\b(hai|kar|kaise|kya)\b'
-#     ],
-#     'hi': [
-#         r'[\u0900-\u097F]+',  # Devanagari script
-#         r'\b(क्या|कैसे|कहाँ|क्यों|मतलब|अभी|फिर|वाला|वाली|है|हैं|करना|होना)\b'
-#     ],
-#     'ar': [r'[\u0600-\u06FF]+'],  # Arabic script
-#     'bn': [r'[\u0980-\u09FF]+'],  # Bengali script
-#     'ta': [r'[\u0B80-\u0BFF]+'],  # Tamil script
-#     'te': [r'[\u0C00-\u0C7F]+'],  # Telugu script
-#     'mr': [r'[\u0900-\u097F]+'],  # Marathi (Devanagari)
-#     'gu': [r'[\u0A80-\u0AFF]+'],  # Gujarati script
-#     'kn': [r'[\u0C80-\u0CFF]+'],  # Kannada script
-#     'ml': [r'[\u0D00-\u0D7F]+'],  # Malayalam script
-#     'pa': [r'[\u0A00-\u0A7F]+'],  # Punjabi script
-#     'ur': [r'[\u0600-\u06FF]+'],  # Urdu (Arabic script)
-# }
-
-# # --- Load search index ---
-# try:
-#     with open(INDEX_FILE, 'r', encoding='utf-8') as f:
-#         search_index = json.load(f)
-#     logger.info("Search index loaded successfully.")
-# except FileNotFoundError:
-#     logger.error(f"FATAL: '{INDEX_FILE}' not found. Please run build_index.py first.")
-#     search_index = {"documents": [], "idf_scores": {}}
-
-# # --- Enhanced Nonsense Filtering ---
-# IRRELEVANT_TOPICS = {
-#     "vehicles": {
-#         "car", "bike", "truck", "bicycle", "scooter", "train", "aeroplane", "airplane", 
-#         "jet", "boat", "ship", "bus", "auto", "rickshaw", "taxi", "metro", "helicopter",
-#         "motorcycle", "vehicle", "transport", "driving", "parking"
-#     },
-#     "appliances": {
-#         "fridge", "refrigerator", "oven", "stove", "fan", "bulb", "ac", "cooler", 
-#         "mixer", "toaster", "tv", "television", "microwave", "washing", "machine",
-#         "dishwasher", "vacuum", "heater", "iron", "blender", "grinder"
-#     },
-#     "animals": {
-#         "dog", "cat", "elephant", "horse", "monkey", "tiger", "lion", "goat", "cow",
-#         "bird", "fish", "rabbit", "chicken", "pig", "sheep", "buffalo", "deer",
-#         "snake", "lizard", "frog", "insect", "spider", "ant", "bee", "butterfly"
-#     },
-#     "foods": {
-#         "pizza", "burger", "cake", "bread", "milk", "apple", "rice", "chapati", 
-#         "noodles", "icecream", "chicken", "mutton", "fish", "egg", "vegetable",
-#         "fruit", "sweet", "spicy", "cooking", "recipe", "restaurant", "hotel"
-#     },
-#     "clothing": {
-#         "jeans", "shirt", "jacket", "tshirt", "saree", "kurta", "shoes", "cap",
-#         "dress", "pants", "socks", "underwear", "bra", "belt", "watch", "jewelry",
-#         "ring", "necklace", "earring", "bag", "purse", "wallet"
-#     },
-#     "entertainment": {
-#         "movie", "film", "song", "music", "dance", "party", "game", "cricket",
-#         "football", "tennis", "sport", "tv", "serial", "drama", "comedy",
-#         "actor", "actress", "singer", "musician", "celebrity", "star"
-#     },
-#     "education": {
-#         "school", "college", "university", "exam", "test", "study", "book",
-#         "teacher", "student", "homework", "assignment", "project", "degree",
-#         "course", "subject", "math", "science", "history", "geography"
-#     },
-#     "body_parts": {
-#         "head", "hair", "eye", "nose", "mouth", "ear", "hand", "finger", "leg",
-#         "foot", "back", "stomach", "chest", "arm", "shoulder", "knee", "elbow",
-#         "face", "skin", "tooth", "teeth", "tongue", "nail"
-#     },
-#     "nature": {
-#         "tree", "flower", "plant", "garden", "park", "mountain", "river", "sea",
-#         "ocean", "sky", "cloud", "rain", "sun", "moon", "star", "wind", "fire",
-#         "water", "earth", "stone", "rock", "sand", "grass", "leaf"
-#     },
-#     "other": {
-#         "road", "girl", "boy", "kid", "pen", "bottle", "house", "wall", "door",
-#         "window", "chair", "table", "bed", "room", "kitchen", "bathroom", "office",
-#         "market", "shop", "money", "rupee", "dollar", "bank", "atm", "card"
-#     }
-# }
-
-# # Enhanced nonsense filter with more comprehensive coverage
-# NONSENSE_FILTER = {
-#     "download": set.union(*IRRELEVANT_TOPICS.values()),
-#     "save": set.union(*IRRELEVANT_TOPICS.values()),
-#     "install": set.union(*IRRELEVANT_TOPICS.values()),
-#     "upload": set.union(*IRRELEVANT_TOPICS.values()),
-#     "record": set.union(*IRRELEVANT_TOPICS.values()),
-#     "create": set.union(*IRRELEVANT_TOPICS.values()),
-#     "make": set.union(*IRRELEVANT_TOPICS.values()),
-#     "build": set.union(*IRRELEVANT_TOPICS.values()),
-#     "get": set.union(*IRRELEVANT_TOPICS.values()),
-#     "buy": set.union(*IRRELEVANT_TOPICS.values()),
-#     "sell": set.union(*IRRELEVANT_TOPICS.values()),
-#     "find": set.union(*IRRELEVANT_TOPICS.values()),
-#     "search": set.union(*IRRELEVANT_TOPICS.values()),
-# }
-
-# # Context keywords that should boost relevance scores
-# WHATSAPP_CONTEXT_KEYWORDS = {
-#     "whatsapp", "status", "saver", "download", "save", "story", "media", "video", 
-#     "photo", "image", "chat", "message", "contact", "group", "call", "notification",
-#     "backup", "restore", "privacy", "block", "unblock", "mute", "archive", "delete",
-#     "forward", "reply", "share", "send", "receive", "online", "offline", "last seen"
-# }
-
-# def enhanced_language_detection(text):
-#     """Enhanced language detection with pattern matching and fallback"""
-#     text_lower = text.lower()
-    
-#     # First try pattern-based detection for specific languages
-#     for lang, patterns in LANGUAGE_PATTERNS.items():
-#         for pattern in patterns:
-#             if re.search(pattern, text, re.IGNORECASE):
-#                 logger.info(f"Pattern-based detection: {lang}")
-#                 return lang
-    
-#     # Try langdetect library
-#     try:
-#         detected_lang = detect(text)
-#         if detected_lang in LANGUAGES:
-#             logger.info(f"Langdetect detection: {detected_lang}")
-#             return detected_lang
-#     except LangDetectException:
-#         pass
-    
-#     # Check for mixed language indicators (Hinglish)
-#     english_words = len(re.findall(r'\b[a-zA-Z]+\b', text))
-#     total_words = len(text.split())
-#     if total_words > 0 and 0.3 <= (english_words / total_words) <= 0.8:
-#         # Check for Hindi/Devanagari characters
-#         if re.search(r'[\u0900-\u097F]', text) or \
-#            re.search(r'\b(hai|hain|kar|kya|kaise|kahan|kyun|matlab|bhai|yaar)\b', text_lower):
-#             logger.info("Mixed language detection: hinglish")
-#             return 'hinglish'
-    
-#     # Default fallback
-#     logger.info("Defaulting to English")
-#     return 'en'
-
-# def normalize_and_tokenize_query(text):
-#     """Enhanced tokenization with better handling of special characters"""
-#     if not isinstance(text, str): 
-#         return []
-    
-#     text = text.lower()
-#     # Preserve important punctuation and Unicode characters
-#     text = re.sub(r"[^\w\s\u0900-\u097F\u0600-\u06FF\u0980-\u09FF\u0B80-\u0BFF\u0C00-\u0C7F\u0A80-\u0AFF\u0C80-\u0CFF\u0D00-\u0D7F\u0A00-\u0A7F]", " ", text)
-#     # Remove extra whitespace
-#     text = re.sub(r'\s+', ' ', text).strip()
-    
-#     tokens = text.split()
-#     # Remove very short tokens (less than 2 characters) unless they're important
-#     important_short_words = {'id', 'hi', 'ok', 'no', 'go', 'do', 'me', 'my', 'we', 'up'}
-#     tokens = [token for token in tokens if len(token) >= 2 or token in important_short_words]
-    
-#     return tokens
-
-# def is_nonsensical_query(tokens):
-#     """Enhanced nonsense detection with context awareness"""
-#     if not tokens:
-#         return True
-    
-#     # Check for too short queries
-#     if len(tokens) == 1 and tokens[0] not in WHATSAPP_CONTEXT_KEYWORDS:
-#         return True
-    
-#     # Check for nonsensical combinations
-#     for verb, invalid_targets in NONSENSE_FILTER.items():
-#         if verb in tokens:
-#             invalid_count = sum(1 for word in tokens if word in invalid_targets)
-#             # If more than half the query consists of irrelevant terms
-#             if invalid_count > len(tokens) // 2:
-#                 return True
-    
-#     # Check for completely irrelevant queries
-#     irrelevant_count = 0
-#     all_irrelevant = set.union(*IRRELEVANT_TOPICS.values())
-#     for token in tokens:
-#         if token in all_irrelevant:
-#             irrelevant_count += 1
-    
-#     # If more than 70% of tokens are irrelevant and no WhatsApp context
-#     if irrelevant_count > len(tokens) * 0.7:
-#         has_context = any(token in WHATSAPP_CONTEXT_KEYWORDS for token in tokens)
-#         if not has_context:
-#             return True
-    
-#     return False
-
-# def calculate_enhanced_score(user_keywords, doc_keywords, idf_scores):
-#     """Enhanced scoring algorithm with multiple factors"""
-#     if not user_keywords or not doc_keywords:
-#         return 0
-    
-#     total_score = 0
-#     matched_keywords = set()
-#     context_bonus = 0
-    
-#     # Primary fuzzy matching score
-#     for user_word in user_keywords:
-#         best_match = process.extractOne(user_word, doc_keywords, scorer=fuzz.ratio)
-#         if best_match and best_match[1] >= FUZZY_MATCH_THRESHOLD:
-#             matched_keyword = best_match[0]
-#             matched_keywords.add(matched_keyword)
-            
-#             # Base similarity score
-#             similarity_score = best_match[1] / 100
-            
-#             # IDF importance weight
-#             keyword_importance = idf_scores.get(matched_keyword, 0.05)
-            
-#             # Context relevance bonus
-#             if user_word in WHATSAPP_CONTEXT_KEYWORDS:
-#                 context_bonus += 0.2
-            
-#             # Length penalty for very short matches
-#             length_factor = min(len(user_word) / 4, 1.0)
-            
-#             word_score = similarity_score * keyword_importance * length_factor
-#             total_score += word_score
-    
-#     # Coverage bonus - reward matching more unique keywords
-#     coverage_ratio = len(matched_keywords) / len(user_keywords) if user_keywords else 0
-#     coverage_bonus = coverage_ratio * 0.3
-    
-#     # Context bonus for WhatsApp-related queries
-#     final_score = (total_score + coverage_bonus + context_bonus)
-    
-#     # Apply context multiplier if query is clearly WhatsApp-related
-#     whatsapp_keywords_found = sum(1 for kw in user_keywords if kw in WHATSAPP_CONTEXT_KEYWORDS)
-#     if whatsapp_keywords_found >= 1:
-#         final_score *= CONTEXT_BONUS_MULTIPLIER
-    
-#     return final_score
-
-# def find_best_match(user_query):
-#     """Enhanced matching with improved scoring"""
-#     user_keywords = normalize_and_tokenize_query(user_query)
-#     if not user_keywords:
-#         return None
-
-#     documents = search_index.get('documents', [])
-#     idf_scores = search_index.get('idf_scores', {})
-
-#     best_score = 0
-#     best_match_doc = None
-    
-#     # Store all matches for potential ensemble scoring
-#     matches = []
-
-#     for doc in documents:
-#         doc_keywords = doc['keywords']
-#         current_doc_score = calculate_enhanced_score(user_keywords, doc_keywords, idf_scores)
-        
-#         matches.append((doc, current_doc_score))
-        
-#         if current_doc_score > best_score:
-#             best_score = current_doc_score
-#             best_match_doc = doc
-
-#     # Log top matches for debugging
-#     matches.sort(key=lambda x: x[1], reverse=True)
-#     logger.info(f"Top 3 matches for '{user_query}':")
-#     for i, (doc, score) in enumerate(matches[:3]):
-#         logger.info(f"  {i+1}. Score: {score:.3f} - {doc.get('id', 'Unknown')}")
-
-#     if best_match_doc and best_score >= MINIMUM_SCORE_THRESHOLD:
-#         logger.info(f"Selected match for '{user_query}' with score {best_score:.3f}")
-#         return best_match_doc
-#     else:
-#         logger.warning(f"No good match found for '{user_query}' (best score: {best_score:.3f})")
-#         return None
-
-# def get_fallback_response(lang):
-#     """Enhanced fallback responses in multiple languages"""
-#     fallback_responses = {
-#         'en': "I'm sorry, I couldn't understand that. Try asking something about WhatsApp Status Saver, like 'how to save status' or 'download WhatsApp videos'.",
-#         'hi': "माफ करें, मैं समझ नहीं पाया। WhatsApp Status Saver के बारे में कुछ पूछिए जैसे 'स्टेटस कैसे सेव करें' या 'WhatsApp वीडियो डाउनलोड करें'।",
-#         'hinglish': "Sorry, main samajh nahi paya. WhatsApp Status Saver ke bare me kuch pucho jaise 'status kaise save kare' ya 'WhatsApp video download kare'.",
-#         'es': "Lo siento, no pude entender eso. Prueba preguntando algo sobre WhatsApp Status Saver, como 'cómo guardar estado' o 'descargar videos de WhatsApp'.",
-#         'fr': "Désolé, je n'ai pas pu comprendre cela. Essayez de demander quelque chose sur WhatsApp Status Saver, comme 'comment sauvegarder le statut' ou 'télécharger des vidéos WhatsApp'.",
-#         'ar': "آسف، لم أستطع فهم ذلك. جرب أن تسأل شيئًا عن WhatsApp Status Saver، مثل 'كيفية حفظ الحالة' أو 'تحميل فيديوهات WhatsApp'.",
-#         'pt': "Desculpe, não consegui entender isso. Tente perguntar algo sobre WhatsApp Status Saver, como 'como salvar status' ou 'baixar vídeos do WhatsApp'.",
-#     }
-#     return fallback_responses.get(lang, fallback_responses['en'])
-
-# def get_nonsense_response(lang):
-#     """Enhanced nonsense responses in multiple languages"""
-#     nonsense_responses = {
-#         'en': "That doesn't seem related to WhatsApp or Status Saver. Please ask something relevant like 'how to save a status' or 'download WhatsApp media'.",
-#         'hi': "यह WhatsApp या Status Saver से संबंधित नहीं लगता। कृपया कोई प्रासंगिक प्रश्न पूछें जैसे 'स्टेटस कैसे सेव करें' या 'WhatsApp मीडिया डाउनलोड करें'।",
-#         'hinglish': "Ye WhatsApp ya Status Saver se related nahi lagta. Please koi relevant question pucho jaise 'status kaise save kare' ya 'WhatsApp media download kare'.",
-#         'es': "Eso no parece estar relacionado con WhatsApp o Status Saver. Por favor pregunta algo relevante como 'cómo guardar un estado' o 'descargar medios de WhatsApp'.",
-#         'fr': "Cela ne semble pas lié à WhatsApp ou Status Saver. Veuillez poser une question pertinente comme 'comment sauvegarder un statut' ou 'télécharger des médias WhatsApp'.",
-#         'ar': "هذا لا يبدو متعلقًا بـ WhatsApp أو Status Saver. يرجى طرح سؤال ذي صلة مثل 'كيفية حفظ حالة' أو 'تحميل وسائط WhatsApp'.",
-#         'pt': "Isso não parece estar relacionado ao WhatsApp ou Status Saver. Por favor, faça uma pergunta relevante como 'como salvar um status' ou 'baixar mídia do WhatsApp'.",
-#     }
-#     return nonsense_responses.get(lang, nonsense_responses['en'])
-
-# # --- HTML Template (Enhanced) ---
-# HTML_TEMPLATE = """
-# <!DOCTYPE html>
-# <html lang="en">
-# <head>
-#     <meta charset="UTF-8">
-#     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-#     <title>WhatsApp Status Saver - FAQ Bot</title>
-#     <style>
-#         body {
-#             font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-#             margin: 0;
-#             padding: 20px;
-#             background: linear-gradient(135deg, #25D366, #128C7E);
-#             min-height: 100vh;
-#         }
-#         .container {
-#             max-width: 800px;
-#             margin: 0 auto;
-#             background: white;
-#             border-radius: 15px;
-#             box-shadow: 0 10px 30px rgba(0,0,0,0.2);
-#             overflow: hidden;
-#         }
-#         .header {
-#             background: #075E54;
-#             color: white;
-#             padding: 20px;
-#             text-align: center;
-#         }
-#         .chat-container {
-#             height: 400px;
-#             overflow-y: auto;
-#             padding: 20px;
-#             background: #f0f0f0;
-#         }
-#         .message {
-#             margin: 10px 0;
-#             padding: 10px 15px;
-#             border-radius: 10px;
-#             max-width: 80%;
-#         }
-#         .user-message {
-#             background: #DCF8C6;
-#             margin-left: auto;
-#             text-align: right;
-#         }
-#         .bot-message {
-#             background: white;
-#             border: 1px solid #ddd;
-#         }
-#         .input-container {
-#             display: flex;
-#             padding: 20px;
-#             background: white;
-#         }
-#         .input-container input {
-#             flex: 1;
-#             padding: 12px;
-#             border: 2px solid #25D366;
-#             border-radius: 25px;
-#             outline: none;
-#             font-size: 16px;
-#         }
-#         .input-container button {
-#             background: #25D366;
-#             color: white;
-#             border: none;
-#             padding: 12px 20px;
-#             margin-left: 10px;
-#             border-radius: 25px;
-#             cursor: pointer;
-#             font-size: 16px;
-#         }
-#         .input-container button:hover {
-#             background: #1ea851;
-#         }
-#         .language-info {
-#             text-align: center;
-#             padding: 10px;
-#             font-size: 12px;
-#             color: #666;
-#             background: #f9f9f9;
-#         }
-#     </style>
-# </head>
-# <body>
-#     <div class="container">
-#         <div class="header">
-#             <h1>🗨️ WhatsApp Status Saver FAQ Bot</h1>
-#             <p>Ask me anything about WhatsApp Status Saver!</p>
-#         </div>
-#         <div class="language-info">
-#             Supported languages: English, Hindi, Hinglish, Spanish, French, German, Portuguese, Arabic, Bengali, Tamil, Telugu, Marathi, Gujarati, Kannada, Malayalam, Punjabi, Oriya, Assamese, Urdu
-#         </div>
-#         <div class="chat-container" id="chatContainer">
-#             <div class="message bot-message">
-#                 Hello! I'm here to help you with WhatsApp Status Saver. You can ask me questions in multiple languages!
-#             </div>
-#         </div>
-#         <div class="input-container">
-#             <input type="text" id="messageInput" placeholder="Type your question here..." onkeypress="handleKeyPress(event)">
-#             <button onclick="sendMessage()">Send</button>
-#         </div>
-#     </div>
-
-#     <script>
-#         function handleKeyPress(event) {
-#             if (event.key === 'Enter') {
-#                 sendMessage();
-#             }
-#         }
-
-#         function sendMessage() {
-#             const input = document.getElementById('messageInput');
-#             const message = input.value.trim();
-#             if (!message) return;
-
-#             const chatContainer = document.getElementById('chatContainer');
-            
-#             // Add user message
-#             const userDiv = document.createElement('div');
-#             userDiv.className = 'message user-message';
-#             userDiv.textContent = message;
-#             chatContainer.appendChild(userDiv);
-
-#             // Clear input
-#             input.value = '';
-
-#             // Send to server
-#             fetch('/chat', {
-#                 method: 'POST',
-#                 headers: {
-#                     'Content-Type': 'application/json',
-#                 },
-#                 body: JSON.stringify({message: message})
-#             })
-#             .then(response => response.json())
-#             .then(data => {
-#                 const botDiv = document.createElement('div');
-#                 botDiv.className = 'message bot-message';
-#                 botDiv.textContent = data.response;
-#                 chatContainer.appendChild(botDiv);
-#                 chatContainer.scrollTop = chatContainer.scrollHeight;
-#             })
-#             .catch(error => {
-#                 const errorDiv = document.createElement('div');
-#                 errorDiv.className = 'message bot-message';
-#                 errorDiv.textContent = 'Sorry, there was an error processing your request.';
-#                 chatContainer.appendChild(errorDiv);
-#                 chatContainer.scrollTop = chatContainer.scrollHeight;
-#             });
-
-#             chatContainer.scrollTop = chatContainer.scrollHeight;
-#         }
-#     </script>
-# </body>
-# </html>
-# """
-
-# @app.route('/')
-# def home():
-#     return render_template_string(HTML_TEMPLATE)
-
-# @app.route('/chat', methods=['POST'])
-# def chat():
-#     user_input = request.json.get('message', '').strip()
-#     if not user_input:
-#         return jsonify({"response": "Please enter a question."})
-
-#     # Normalize and tokenize
-#     tokens = normalize_and_tokenize_query(user_input)
-
-#     # Enhanced language detection
-#     try:
-#         reply_lang = enhanced_language_detection(user_input)
-#     except Exception as e:
-#         logger.warning(f"Language detection error: {e}")
-#         reply_lang = 'en'
-
-#     # Check for nonsensical queries
-#     if is_nonsensical_query(tokens):
-#         response_text = get_nonsense_response(reply_lang)
-#         return jsonify({"response": response_text, "detected_language": reply_lang})
-
-#     # Find best matching document
-#     best_doc = find_best_match(user_input)
-
-#     if best_doc:
-#         # Get response in detected language with fallback
-#         response_text = best_doc['answers'].get(reply_lang)
-#         if not response_text:
-#             # Fallback to English if detected language not available
-#             response_text = best_doc['answers'].get('en', 'Sorry, no answer available.')
-        
-#         logger.info(f"Responding in language: {reply_lang}")
-#     else:
-#         response_text = get_fallback_response(reply_lang)
-
-#     return jsonify({
-#         "response": response_text, 
-#         "detected_language": reply_lang,
-#         "query_tokens": tokens[:5]  # First 5 tokens for debugging
-#     })
-
-# if __name__ == '__main__':
-#     logger.info("Starting Enhanced WhatsApp FAQ Bot...")
-#     logger.info(f"Supported languages: {', '.join(LANGUAGES)}")
-#     logger.info(f"Fuzzy match threshold: {FUZZY_MATCH_THRESHOLD}")
-#     logger.info(f"Minimum score threshold: {MINIMUM_SCORE_THRESHOLD}")
-#     app.run(host='0.0.0.0', port=5000, debug=True)
-
-
-# import json
-# import re
-# from flask import Flask, request, jsonify, render_template_string
-# import logging
-# from langdetect import detect, DetectorFactory
-# from rapidfuzz import process, fuzz
-
-# app = Flask(__name__)
-
-# # --- CONFIGURATION ---
-# logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-# logger = logging.getLogger(__name__)
-# DetectorFactory.seed = 0
-
-# INDEX_FILE = 'faq_index.json'
-# LANGUAGES = ["en", "hi", "id"]
-# FUZZY_MATCH_THRESHOLD = 80 # A good starting point for typo tolerance
-# MINIMUM_SCORE_THRESHOLD = 0.25 # Threshold for a match to be considered valid
-
-# # --- LOAD THE UNIFIED SEARCH INDEX ---
-# try:
-#     with open(INDEX_FILE, 'r', encoding='utf-8') as f:
-#         search_index = json.load(f)
-#     logger.info("Final search index loaded successfully.")
-# except FileNotFoundError:
-#     logger.error(f"FATAL: '{INDEX_FILE}' not found. Please run build_index.py first.")
-#     # For demo purposes, create a simple fallback
-#     search_index = {
-#         'documents': [
-#             {
-#                 'id': 'demo_1',
-#                 'keywords': ['hello', 'hi', 'greeting'],
-#                 'answers': {
-#                     'en': 'Hello! How can I help you today?',
-#                     'hi': 'नमस्ते! मैं आपकी कैसे सहायता कर सकता हूं?',
-#                     'id': 'Halo! Bagaimana saya bisa membantu Anda hari ini?'
-#                 }
-#             }
-#         ],
-#         'idf_scores': {'hello': 0.5, 'hi': 0.5, 'greeting': 0.5}
-#     }
-
-# def normalize_and_tokenize_query(text):
-#     if not isinstance(text, str): return []
-#     text = text.lower()
-#     # Remove punctuation
-#     text = re.sub(r"[^\w\s\u0900-\u097F]", "", text)
-#     return text.split()
-
-# def find_best_match(user_query):
-#     """Searches the unified index using IDF and fuzzy matching, returning the best document."""
-#     user_keywords = normalize_and_tokenize_query(user_query)
-#     if not user_keywords:
-#         return None
-
-#     documents = search_index.get('documents', [])
-#     idf_scores = search_index.get('idf_scores', {})
-    
-#     best_score = 0
-#     best_match_doc = None
-
-#     for doc in documents:
-#         doc_keywords = doc['keywords']
-#         current_doc_score = 0
-        
-#         for user_word in user_keywords:
-#             # Find the best fuzzy match for the user's word in this document's keywords
-#             best_match = process.extractOne(user_word, doc_keywords, scorer=fuzz.ratio)
-            
-#             if best_match and best_match[1] >= FUZZY_MATCH_THRESHOLD:
-#                 matched_keyword = best_match[0]
-#                 keyword_importance = idf_scores.get(matched_keyword, 0.05)
-#                 current_doc_score += (best_match[1] / 100) * keyword_importance
-
-#         if current_doc_score > best_score:
-#             best_score = current_doc_score
-#             best_match_doc = doc
-            
-#     if best_match_doc and best_score >= MINIMUM_SCORE_THRESHOLD:
-#         logger.info(f"Found match for '{user_query}' in doc '{best_match_doc['id']}' with score {best_score:.2f}")
-#         return best_match_doc
-#     else:
-#         logger.warning(f"No good match found for query '{user_query}' (Best score: {best_score:.2f})")
-#         return None
-
-# # Enhanced HTML Template with authentic WhatsApp styling
-# HTML_TEMPLATE = """
-# <!DOCTYPE html>
-# <html lang="en">
-# <head>
-#     <meta charset="UTF-8">
-#     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-#     <title>WhatsApp FAQ Bot</title>
-#     <style>
-#         @import url('https://fonts.googleapis.com/css2?family=Roboto:wght@300;400;500;600&display=swap');
-        
-#         * {
-#             margin: 0;
-#             padding: 0;
-#             box-sizing: border-box;
-#         }
-        
-#         body {
-#             font-family: 'Roboto', sans-serif;
-#             background: #e5ddd5;
-#             display: flex;
-#             justify-content: center;
-#             align-items: center;
-#             min-height: 100vh;
-#             padding: 20px;
-#         }
-        
-#         .chat-container {
-#             width: 100%;
-#             max-width: 450px;
-#             height: 90vh;
-#             max-height: 700px;
-#             display: flex;
-#             flex-direction: column;
-#             background-color: #f0f0f0;
-#             border-radius: 8px;
-#             box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15);
-#             overflow: hidden;
-#         }
-        
-#         .chat-header {
-#             background: linear-gradient(135deg, #075E54 0%, #128C7E 100%);
-#             color: white;
-#             padding: 15px 20px;
-#             font-weight: 500;
-#             font-size: 1.1rem;
-#             text-align: center;
-#             position: relative;
-#             box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-#         }
-        
-#         .chat-header::before {
-#             content: '';
-#             position: absolute;
-#             top: 0;
-#             left: 0;
-#             right: 0;
-#             bottom: 0;
-#             background: linear-gradient(45deg, transparent 30%, rgba(255,255,255,0.1) 50%, transparent 70%);
-#             opacity: 0.3;
-#         }
-        
-#         .chat-header h1 {
-#             font-size: 1.1rem;
-#             font-weight: 500;
-#             position: relative;
-#             z-index: 1;
-#         }
-        
-#         .chat-box {
-#             flex-grow: 1;
-#             padding: 20px;
-#             overflow-y: auto;
-#             background-color: #e5ddd5;
-#             background-image: url('https://user-images.githubusercontent.com/15075759/28719144-86dc0f70-73b1-11e7-911d-60d70fcded21.png');
-#             background-repeat: repeat;
-#             background-size: auto;
-#         }
-        
-#         .chat-box::-webkit-scrollbar {
-#             width: 6px;
-#         }
-        
-#         .chat-box::-webkit-scrollbar-track {
-#             background: transparent;
-#         }
-        
-#         .chat-box::-webkit-scrollbar-thumb {
-#             background: rgba(0, 0, 0, 0.2);
-#             border-radius: 10px;
-#         }
-        
-#         .message {
-#             display: flex;
-#             margin-bottom: 15px;
-#             max-width: 80%;
-#             animation: messageSlide 0.3s ease-out;
-#         }
-        
-#         @keyframes messageSlide {
-#             from {
-#                 opacity: 0;
-#                 transform: translateY(10px);
-#             }
-#             to {
-#                 opacity: 1;
-#                 transform: translateY(0);
-#             }
-#         }
-        
-#         .message-content {
-#             padding: 10px 15px;
-#             border-radius: 12px;
-#             line-height: 1.4;
-#             white-space: pre-wrap;
-#             word-wrap: break-word;
-#             position: relative;
-#             box-shadow: 0 1px 2px rgba(0, 0, 0, 0.1);
-#             font-size: 14px;
-#         }
-        
-#         .user {
-#             margin-left: auto;
-#             flex-direction: row-reverse;
-#         }
-        
-#         .user .message-content {
-#             background-color: #dcf8c6;
-#             color: #303030;
-#             border-top-right-radius: 0;
-#         }
-        
-#         .user .message-content::after {
-#             content: '';
-#             position: absolute;
-#             bottom: 0;
-#             right: -8px;
-#             width: 0;
-#             height: 0;
-#             border: 8px solid transparent;
-#             border-left-color: #dcf8c6;
-#             border-bottom: none;
-#             border-right: none;
-#         }
-        
-#         .bot .message-content {
-#             background-color: #ffffff;
-#             color: #303030;
-#             border-top-left-radius: 0;
-#         }
-        
-#         .bot .message-content::after {
-#             content: '';
-#             position: absolute;
-#             bottom: 0;
-#             left: -8px;
-#             width: 0;
-#             height: 0;
-#             border: 8px solid transparent;
-#             border-right-color: #ffffff;
-#             border-bottom: none;
-#             border-left: none;
-#         }
-        
-#         .typing-indicator {
-#             display: none;
-#             padding: 10px 15px;
-#             background-color: #ffffff;
-#             border-radius: 12px;
-#             border-top-left-radius: 0;
-#             align-items: center;
-#             box-shadow: 0 1px 2px rgba(0, 0, 0, 0.1);
-#             animation: messageSlide 0.3s ease-out;
-#         }
-        
-#         .typing-indicator::after {
-#             content: '';
-#             position: absolute;
-#             bottom: 0;
-#             left: -8px;
-#             width: 0;
-#             height: 0;
-#             border: 8px solid transparent;
-#             border-right-color: #ffffff;
-#             border-bottom: none;
-#             border-left: none;
-#         }
-        
-#         .typing-indicator span {
-#             height: 8px;
-#             width: 8px;
-#             background-color: #999;
-#             border-radius: 50%;
-#             display: inline-block;
-#             margin: 0 2px;
-#             animation: bounce 1.3s infinite ease-in-out;
-#         }
-        
-#         .typing-indicator span:nth-child(2) { animation-delay: -1.1s; }
-#         .typing-indicator span:nth-child(3) { animation-delay: -0.9s; }
-        
-#         @keyframes bounce {
-#             0%, 80%, 100% {
-#                 transform: scale(0);
-#             }
-#             40% {
-#                 transform: scale(1.0);
-#             }
-#         }
-        
-#         .input-area {
-#             display: flex;
-#             padding: 10px;
-#             background-color: #f0f0f0;
-#             border-top: 1px solid #ddd;
-#             gap: 10px;
-#         }
-        
-#         #user-input {
-#             flex-grow: 1;
-#             border: none;
-#             padding: 12px 15px;
-#             border-radius: 25px;
-#             font-size: 1rem;
-#             font-family: 'Roboto', sans-serif;
-#             background-color: white;
-#             transition: all 0.2s ease;
-#         }
-        
-#         #user-input:focus {
-#             outline: none;
-#             box-shadow: 0 0 0 2px rgba(37, 211, 102, 0.3);
-#         }
-        
-#         #user-input::placeholder {
-#             color: #999;
-#         }
-        
-#         #send-btn {
-#             background: linear-gradient(135deg, #128C7E 0%, #075E54 100%);
-#             color: white;
-#             border: none;
-#             border-radius: 50%;
-#             width: 50px;
-#             height: 50px;
-#             cursor: pointer;
-#             font-size: 24px;
-#             display: flex;
-#             justify-content: center;
-#             align-items: center;
-#             transition: all 0.2s ease;
-#             box-shadow: 0 2px 4px rgba(0, 0, 0, 0.2);
-#         }
-        
-#         #send-btn:hover {
-#             background: linear-gradient(135deg, #075E54 0%, #128C7E 100%);
-#             transform: translateY(-1px);
-#             box-shadow: 0 4px 8px rgba(0, 0, 0, 0.3);
-#         }
-        
-#         #send-btn:active {
-#             transform: translateY(0);
-#         }
-        
-#         #send-btn:disabled {
-#             opacity: 0.6;
-#             cursor: not-allowed;
-#             transform: none;
-#         }
-        
-#         /* Mobile responsiveness */
-#         @media (max-width: 480px) {
-#             body {
-#                 padding: 10px;
-#             }
-            
-#             .chat-container {
-#                 height: 95vh;
-#                 border-radius: 0;
-#             }
-            
-#             .chat-header {
-#                 padding: 12px 16px;
-#             }
-            
-#             .chat-box {
-#                 padding: 16px;
-#             }
-            
-#             .input-area {
-#                 padding: 8px;
-#             }
-            
-#             .message {
-#                 max-width: 85%;
-#             }
-#         }
-        
-#         /* Loading animation for send button */
-#         .loading {
-#             animation: spin 1s linear infinite;
-#         }
-        
-#         @keyframes spin {
-#             from { transform: rotate(0deg); }
-#             to { transform: rotate(360deg); }
-#         }
-#     </style>
-# </head>
-# <body>
-#     <div class="chat-container">
-#         <div class="chat-header">
-#             <h1>WhatsApp FAQ Bot</h1>
-#         </div>
-#         <div class="chat-box" id="chat-box">
-#             <div class="message bot">
-#                 <div class="message-content">Hello! How can I assist you today?</div>
-#             </div>
-#         </div>
-#         <div class="input-area">
-#             <input type="text" id="user-input" placeholder="Type your question..." autocomplete="off">
-#             <button id="send-btn">&#10148;</button>
-#         </div>
-#     </div>
-
-#     <script>
-#         const chatBox = document.getElementById('chat-box');
-#         const userInput = document.getElementById('user-input');
-#         const sendBtn = document.getElementById('send-btn');
-#         let isProcessing = false;
-
-#         function addMessage(content, type) {
-#             const messageDiv = document.createElement('div');
-#             messageDiv.classList.add('message', type);
-            
-#             const messageContent = document.createElement('div');
-#             messageContent.classList.add('message-content');
-#             messageContent.innerHTML = content.replace(/\\n/g, '<br>');
-            
-#             messageDiv.appendChild(messageContent);
-#             chatBox.appendChild(messageDiv);
-            
-#             // Smooth scroll to bottom
-#             setTimeout(() => {
-#                 chatBox.scrollTop = chatBox.scrollHeight;
-#             }, 100);
-#         }
-
-#         function showTypingIndicator() {
-#             const typingDiv = document.createElement('div');
-#             typingDiv.classList.add('message', 'bot');
-#             typingDiv.innerHTML = '<div class="typing-indicator"><span></span><span></span><span></span></div>';
-#             chatBox.appendChild(typingDiv);
-            
-#             const indicator = typingDiv.querySelector('.typing-indicator');
-#             indicator.style.display = 'flex';
-            
-#             setTimeout(() => {
-#                 chatBox.scrollTop = chatBox.scrollHeight;
-#             }, 100);
-#         }
-
-#         function hideTypingIndicator() {
-#             const indicator = document.querySelector('.typing-indicator');
-#             if (indicator) {
-#                 indicator.closest('.message').remove();
-#             }
-#         }
-
-#         async function handleSendMessage() {
-#             const message = userInput.value.trim();
-#             if (!message || isProcessing) return;
-
-#             isProcessing = true;
-#             sendBtn.disabled = true;
-#             sendBtn.innerHTML = '⟳';
-#             sendBtn.classList.add('loading');
-
-#             addMessage(message, 'user');
-#             userInput.value = '';
-
-#             showTypingIndicator();
-
-#             // Simulate network delay
-#             await new Promise(resolve => setTimeout(resolve, 400));
-
-#             try {
-#                 const response = await fetch('/chat', {
-#                     method: 'POST',
-#                     headers: { 'Content-Type': 'application/json' },
-#                     body: JSON.stringify({ message: message })
-#                 });
-
-#                 const data = await response.json();
-#                 hideTypingIndicator();
-                
-#                 // Add a small delay for better UX
-#                 setTimeout(() => {
-#                     addMessage(data.response, 'bot');
-#                 }, 200);
-
-#             } catch (error) {
-#                 hideTypingIndicator();
-#                 addMessage('Sorry, something went wrong. Please try again.', 'bot');
-#                 console.error('Error:', error);
-#             } finally {
-#                 isProcessing = false;
-#                 sendBtn.disabled = false;
-#                 sendBtn.innerHTML = '&#10148;';
-#                 sendBtn.classList.remove('loading');
-#                 userInput.focus();
-#             }
-#         }
-
-#         sendBtn.addEventListener('click', handleSendMessage);
-        
-#         userInput.addEventListener('keypress', (e) => {
-#             if (e.key === 'Enter') {
-#                 e.preventDefault();
-#                 handleSendMessage();
-#             }
-#         });
-
-#         // Auto-focus input on load
-#         window.addEventListener('load', () => {
-#             userInput.focus();
-#         });
-
-#         // Add some interactive feedback
-#         userInput.addEventListener('input', () => {
-#             if (userInput.value.trim()) {
-#                 sendBtn.style.opacity = '1';
-#             } else {
-#                 sendBtn.style.opacity = '0.7';
-#             }
-#         });
-#     </script>
-# </body>
-# </html>
-# """
-
-# @app.route('/')
-# def home():
-#     return render_template_string(HTML_TEMPLATE)
-
-# @app.route('/chat', methods=['POST'])
-# def chat():
-#     user_input = request.json.get('message', '').strip().lower()
-#     if not user_input:
-#         return jsonify({"response": "Please enter a question."})
-
-#     # Handle greetings
-#     if user_input in ["hi", "hello", "hey", "namaste", "hola", "hii", "helo", "hey there", "yo", "hai"]:
-#         return jsonify({"response": "Hello! How can I assist you today?"})
-
-#     # Handle bot identity questions
-#     if any(phrase in user_input for phrase in ["your role", "who are you", "what are you", "what is your job", "tum kaun ho", "kya tum bot ho", "bot kaun hai"]):
-#         return jsonify({"response": "I'm your WhatsApp FAQ Bot — a virtual assistant here to answer your questions about the Status Saver app!"})
-
-#     try:
-#         reply_lang = detect(user_input)
-#         if reply_lang not in LANGUAGES:
-#             reply_lang = 'en'
-#     except Exception:
-#         reply_lang = 'en'
-
-#     logger.info(f"Detected reply language: '{reply_lang}' for query: '{user_input}'")
-#     best_doc = find_best_match(user_input)
-
-#     if best_doc:
-#         response_text = best_doc['answers'].get(reply_lang, best_doc['answers']['en'])
-#     else:
-#         response_text = "I'm sorry, I didn't understand the question. Please rephrase your question and try to be more specific."
-
-#     return jsonify({"response": response_text})
-
-
-# if __name__ == '__main__':
-#     logger.info("Starting WhatsApp FAQ Bot Flask server...")
-#     app.run(host='0.0.0.0', port=5000, debug=True)
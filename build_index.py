@@ -6,11 +6,12 @@ from math import log
 
 SOURCE_FILE = 'whatsapp_faq_multilingual.json'
 INDEX_FILE = 'faq_index.json'
+STRIP_RE = re.compile(r"[^\w\s\u0900-\u097F]")
 
 def normalize(text):
     if not isinstance(text, str): return []
     text = text.lower()
-    text = re.sub(r"[^\w\s\u0900-\u097F]", "", text)
+    text = STRIP_RE.sub("", text)
     return text.split()
 
 # Load the original multilingual questions
@@ -33,6 +34,12 @@ for entry in raw_data:
         for phr in paraphrases:
             all_keywords.update(normalize(phr))
 
+    # Full questions and paraphrases, kept verbatim so the app can answer an
+    # exact repeat of one without fuzzy matching.
+    phrases = list(entry.get('question', {}).values())
+    for paraphrases in entry.get('paraphrases', {}).values():
+        phrases.extend(paraphrases)
+
     doc_keywords = list(all_keywords)
     for word in doc_keywords:
         word_doc_freq[word] += 1
@@ -40,6 +47,7 @@ for entry in raw_data:
     documents.append({
         "id": doc_id,
         "keywords": doc_keywords,
+        "phrases": phrases,
         "answers": entry.get('answer', {})
     })
 
@@ -1,6 +1,6 @@
 import json
 import tensorflow as tf
-from transformers import TFBertModel, BertTokenizer
+from transformers import TFBertModel, BertTokenizerFast
 import numpy as np
 from sklearn.model_selection import train_test_split
 import logging
@@ -133,8 +133,8 @@ train_questions, val_questions, train_labels, val_labels = train_test_split(
     questions, labels, test_size=0.2, random_state=42
 )
 
-# Tokenize data
-tokenizer = BertTokenizer.from_pretrained('huawei-noah/TinyBERT_General_4L_312D')
+# Tokenize data (the Rust-backed fast tokenizer encodes whole lists in one call)
+tokenizer = BertTokenizerFast.from_pretrained('huawei-noah/TinyBERT_General_4L_312D')
 train_encodings = tokenizer(
     train_questions, truncation=True, padding='max_length', max_length=128,
     return_tensors='tf', return_attention_mask=True
@@ -201,16 +201,21 @@ tf_model.save('finetuned_tinybert_multilingual')
 logger.info("Converting fine-tuned model to TFLite...")
 converter = tf.lite.TFLiteConverter.from_keras_model(tf_model)
 converter.optimizations = [tf.lite.Optimize.DEFAULT]
-converter.target_spec.supported_types = [tf.int8]
+# Restrict to int8 builtin kernels so no op silently falls back to float32.
+converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
 converter.inference_input_type = tf.int8
 converter.inference_output_type = tf.int8
 
+# Calibration samples are tokenized once as a batch and yielded one row at a time.
+calibration_encodings = tokenizer(
+    train_questions[:100], truncation=True, padding='max_length', max_length=128, return_tensors='np'
+)
+calibration_ids = calibration_encodings['input_ids'].astype(np.int32)
+calibration_mask = calibration_encodings['attention_mask'].astype(np.int32)
+
 def representative_dataset():
-    for q in train_questions[:100]:
-        inputs = tokenizer(
-            q, truncation=True, padding='max_length', max_length=128, return_tensors='tf'
-        )
-        yield [inputs['input_ids'].numpy().astype(np.int32), inputs['attention_mask'].numpy().astype(np.int32)]
+    for i in range(len(calibration_ids)):
+        yield [calibration_ids[i:i + 1], calibration_mask[i:i + 1]]
 
 converter.representative_dataset = representative_dataset
 try:
@@ -0,0 +1,15 @@
+# Production server settings, picked up automatically by `gunicorn app:app`.
+# `python app.py` starts Werkzeug's development server: threaded, but a single
+# process, so CPU-bound /chat work from concurrent requests contends for one GIL.
+# Here each CPU core gets its own worker process (and GIL) with a few threads.
+import multiprocessing
+import os
+
+bind = os.environ.get('BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Load app.py (index, keyword tables, langdetect profiles) once in the master
+# before forking, so workers start warm and share those pages copy-on-write.
+preload_app = True